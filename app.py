@@ -3,17 +3,63 @@ Application factory and initialization.
 """
 
 import logging
+import os
+import sys
 from flask import Flask, redirect, request, session, url_for
+from sqlalchemy import event
+from whitenoise import WhiteNoise
 
 from config.config import config
 from models.models import db
 from services.database_service import DatabaseService
 from routes.auth import auth_bp
 from routes.main import main_bp
-from routes.api import api_bp
+from routes.api import api_bp, PROBE_HEADERS, PROBE_RESPONSES
 from utils.logging_config import setup_logging
 from utils.error_handlers import register_error_handlers
 
+PROTECTED_ENDPOINTS = frozenset(
+    map(
+        sys.intern,
+        {
+            "main.dashboard",
+            "main.load",
+            "main.wait",
+            "main.display",
+        },
+    )
+)
+PUBLIC_ENDPOINTS = frozenset(
+    map(
+        sys.intern,
+        {
+            "api.status",
+            "api.health_check",
+            "api.debug_routes",
+            "auth.index",
+            "auth.login",
+            "auth.callback",
+            "main.consent",
+            "favicon",
+        },
+    )
+)
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Let readers run alongside the background writer on SQLite."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 def create_app(config_name="default"):
     """Create Flask application with the given configuration."""
@@ -37,57 +83,82 @@ def create_app(config_name="default"):
     app.register_blueprint(main_bp)
     app.register_blueprint(api_bp)
 
+    # Serve the favicon from memory; the file is read once at startup
+    with open(os.path.join(app.static_folder, "img", "logo.svg"), "rb") as f:
+        favicon = f.read()
+
+    @app.route("/favicon.ico", endpoint="favicon", methods=["GET"])
+    def favicon_ico():
+        """Endpoint for the favicon."""
+        return app.response_class(favicon, 200, {"Content-Type": "image/svg+xml"})
+
+    # Intern endpoint names so endpoint checks compare by identity
+    for rule in app.url_map.iter_rules():
+        rule.endpoint = sys.intern(rule.endpoint)
+
+    # Resolve fixed redirect targets once instead of on every request
+    with app.test_request_context():
+        app.config["INDEX_URL"] = url_for("auth.index")
+        app.config["DASHBOARD_URL"] = url_for("main.dashboard")
+    # Year routes have a fixed shape, so a format template is enough
+    app.config["WAIT_URL"] = "/wait/%d"
+    app.config["DISPLAY_URL"] = "/display/%d"
+
     # Register error handlers
     register_error_handlers(app)
 
+    # Serve static files at the WSGI layer before Flask routing
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app, root=app.static_folder, prefix="static/", max_age=3600
+    )
+
     # Initialize database tables
     with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            event.listen(db.engine, "connect", _set_sqlite_pragmas)
         DatabaseService.init_db()
 
     # Add before request handler
+    index_url = app.config["INDEX_URL"]
+
+    def allow():
+        """Let the request through."""
+        return None
+
+    def require_auth():
+        """Redirect to index unless the user is logged in."""
+        return None if "access_token" in session else redirect(index_url)
+
+    # One lookup per request instead of a chain of membership checks
+    dispatch = dict.fromkeys(PUBLIC_ENDPOINTS, allow)
+    dispatch.update(dict.fromkeys(PROTECTED_ENDPOINTS, require_auth))
+
     @app.before_request
     def before_request():
         """Function to handle actions before each request."""
-        # Skip processing for static files and favicon
+        endpoint = request.endpoint
+
+        # Answer status and health probes without any further processing
         if (
-            request.endpoint == "static"
-            or request.path.startswith("/static/")
-            or request.path == "/favicon.ico"
+            endpoint in PROBE_RESPONSES
+            and request.method in ("HEAD", "GET")
+            and not request.args
         ):
-            return None
+            return app.response_class(PROBE_RESPONSES[endpoint], 200, PROBE_HEADERS)
 
-        protected_endpoints = {
-            "main.dashboard",
-            "main.load",
-            "main.wait",
-            "main.display",
-        }
-        public_endpoints = {
-            "api.status",
-            "api.health_check",
-            "api.debug_routes",
-            "auth.index",
-            "auth.login",
-            "auth.callback",
-            "main.consent",
-        }
+        # Missing static files still reach Flask's static view for the 404
+        if endpoint == "static":
+            return None
 
         # Log current request for debugging
-        logging.debug("Request endpoint: %s, path: %s", request.endpoint, request.path)
-
-        # Allow access to public endpoints
-        if request.endpoint in public_endpoints:
-            return None
+        logging.debug("Request endpoint: %s, path: %s", endpoint, request.path)
 
-        # Redirect to index if not authenticated and accessing protected endpoint
-        if request.endpoint in protected_endpoints and "access_token" not in session:
-            return redirect(url_for("auth.index"))
+        handler = dispatch.get(endpoint)
+        if handler is not None:
+            return handler()
 
         # Redirect unknown endpoints to index
-        if request.endpoint not in (public_endpoints | protected_endpoints):
-            logging.warning("Unknown endpoint accessed: %s", request.endpoint)
-            return redirect(url_for("auth.index"))
-
-        return None
+        logging.warning("Unknown endpoint accessed: %s", endpoint)
+        return redirect(index_url)
 
     return app
@@ -16,12 +16,22 @@ class Config:
     MIN_YEAR = 2008
     CURRENT_YEAR = 2025
 
-    # Secret key should be set from environment or generated once
-    SECRET_KEY = os.getenv("SECRET_KEY") or os.urandom(24).hex()
+    # Secret key should be set from environment so sessions survive restarts;
+    # the random fallback only lasts for the current process
+    SECRET_KEY = (
+        os.getenv("FLASK_SECRET_KEY") or os.getenv("SECRET_KEY") or os.urandom(24).hex()
+    )
     CLIENT_ID = os.getenv("CLIENT_ID")
     CLIENT_SECRET = os.getenv("CLIENT_SECRET")
     SQLALCHEMY_DATABASE_URI = f"sqlite:///my-github-{PROJECT_YEAR}.db"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "connect_args": {"check_same_thread": False, "timeout": 30},
+    }
 
     # GitHub API URLs
     GITHUB_AUTHORIZE_URL = "https://github.com/login/oauth/authorize"
@@ -28,10 +28,11 @@ class UserContext(db.Model):
     """
 
     __tablename__ = "user_contexts"
+    __table_args__ = (db.Index("ix_ctx_user_year", "username", "year"),)
 
     username = db.Column(db.String(80), primary_key=True, nullable=False)
     year = db.Column(db.Integer, primary_key=True, nullable=False)
-    context = db.Column(db.Text, nullable=False)
+    context = db.Column(db.LargeBinary, nullable=False)
     created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
 
     def __repr__(self):
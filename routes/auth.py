@@ -8,10 +8,8 @@ from flask import (
     render_template,
     request,
     session,
-    url_for,
     current_app,
 )
-from services.github_service import GitHubService
 from config.config import Config
 
 auth_bp = Blueprint("auth", __name__)
@@ -21,7 +19,7 @@ auth_bp = Blueprint("auth", __name__)
 def index():
     """Endpoint for the index page."""
     if session.get("access_token"):
-        return redirect(url_for("main.dashboard"))
+        return redirect(current_app.config["DASHBOARD_URL"])
     return render_template(
         "login.html",
         project_year=current_app.config["PROJECT_YEAR"],
@@ -33,7 +31,7 @@ def index():
 def login():
     """Endpoint for the login page."""
     if session.get("access_token"):
-        return redirect(url_for("main.dashboard"))
+        return redirect(current_app.config["DASHBOARD_URL"])
 
     return redirect(
         f"{Config.GITHUB_AUTHORIZE_URL}?client_id={Config.CLIENT_ID}&scope=repo,read:org"
@@ -43,16 +41,19 @@ def login():
 @auth_bp.route("/callback", methods=["GET"])
 def callback():
     """Endpoint for the GitHub OAuth callback."""
+    # pylint: disable=import-outside-toplevel
+    from services.github_service import GitHubService
+
     if "code" not in request.args:
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     code = request.args.get("code")
     if not code:
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     access_token = GitHubService.get_access_token(code)
     if not access_token:
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     session["access_token"] = access_token
-    return redirect(url_for("main.dashboard"))
+    return redirect(current_app.config["DASHBOARD_URL"])
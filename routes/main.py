@@ -2,7 +2,6 @@
 Main application routes.
 """
 
-import json
 import logging
 from datetime import datetime
 from flask import (
@@ -12,14 +11,11 @@ from flask import (
     render_template,
     request,
     session,
-    url_for,
     current_app,
 )
 
 from config.config import Config
 from services.database_service import DatabaseService
-from services.github_service import GitHubService
-from services.data_service import DataService
 
 main_bp = Blueprint("main", __name__)
 
@@ -27,17 +23,22 @@ main_bp = Blueprint("main", __name__)
 @main_bp.route("/dashboard", methods=["GET"])
 def dashboard():
     """Endpoint for the dashboard page."""
+    # pylint: disable=import-outside-toplevel
+    from services.github_service import GitHubService
+
     if not session.get("access_token"):
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     access_token = session.get("access_token")
     user_data = GitHubService.get_user_info(access_token)
 
     if not user_data:
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     username = user_data.get("login")
     session["username"] = username
+    # Keep the basic profile so the background fetch can skip re-querying it
+    session["viewer"] = user_data
     current_year = datetime.now().year
 
     return render_template(
@@ -53,16 +54,28 @@ def dashboard():
 @main_bp.route("/load", methods=["POST"])
 def load():
     """Endpoint to load user data."""
-    data = request.json
+    # pylint: disable=import-outside-toplevel
+    from services.data_service import DataService
+
+    data = request.get_json(silent=True) or {}
 
-    access_token = str(data.get("access_token"))
-    username = str(data.get("username"))
-    timezone = str(data.get("timezone"))
-    year = int(data.get("year"))
+    access_token = data.get("access_token")
+    username = data.get("username")
+    timezone = data.get("timezone")
+    year = data.get("year")
 
     # Validate request data
-    if not DataService.validate_request_data(access_token, username, timezone, year):
-        return jsonify({"redirect_url": url_for("auth.index")})
+    if not (
+        isinstance(access_token, str)
+        and access_token
+        and isinstance(username, str)
+        and username
+        and isinstance(timezone, str)
+        and timezone
+        and isinstance(year, int)
+        and Config.MIN_YEAR <= year <= Config.CURRENT_YEAR
+    ):
+        return jsonify({"redirect_url": current_app.config["INDEX_URL"]})
 
     # Update session
     session["access_token"] = access_token
@@ -70,77 +83,78 @@ def load():
     session["timezone"] = timezone
     session["year"] = year
 
-    # Check if context already exists
-    if DatabaseService.get_user_context(username, year):
-        return jsonify({"redirect_url": url_for("main.display", year=year)})
-
-    # Check if request is already in progress
-    if DatabaseService.get_requested_user(username, year):
-        return jsonify({"redirect_url": url_for("main.wait", year=year)})
-
-    # Add to requested users
-    if not DatabaseService.add_requested_user(username, year):
-        return jsonify({"redirect_url": url_for("auth.index")})
-
-    # Start data processing in background
-    DataService.process_user_data(username, access_token, year, timezone)
-
-    return jsonify({"redirect_url": url_for("main.wait", year=year)})
+    # Check existing state and claim the request in one round-trip
+    match DatabaseService.claim_request(username, year):
+        case "has_context":
+            return jsonify({"redirect_url": current_app.config["DISPLAY_URL"] % year})
+        case "already_requested":
+            return jsonify({"redirect_url": current_app.config["WAIT_URL"] % year})
+        case "claimed":
+            viewer = session.get("viewer")
+            basic_info = viewer if viewer and viewer.get("login") == username else None
+            # Start data processing in background
+            DataService.process_user_data(
+                username, access_token, year, timezone, basic_info
+            )
+            return jsonify({"redirect_url": current_app.config["WAIT_URL"] % year})
+        case _:
+            return jsonify({"redirect_url": current_app.config["INDEX_URL"]})
 
 
 @main_bp.route("/wait/<int:year>", methods=["GET"])
 def wait(year):
     """Endpoint for the wait page."""
     if not session.get("access_token"):
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     # Validate year range
     if not Config.MIN_YEAR <= year <= Config.CURRENT_YEAR:
-        return redirect(url_for("main.dashboard"))
+        return redirect(current_app.config["DASHBOARD_URL"])
 
     username = session.get("username")
+    has_context, has_request = DatabaseService.get_user_state(username, year)
 
     # Check if processing is complete
-    if DatabaseService.get_user_context(username, year):
-        return redirect(url_for("main.display", year=year))
+    if has_context:
+        return redirect(current_app.config["DISPLAY_URL"] % year)
 
     # Check if request exists
-    if DatabaseService.get_requested_user(username, year):
+    if has_request:
         return render_template(
             "wait.html", year=year, project_year=current_app.config["PROJECT_YEAR"]
         )
 
-    return redirect(url_for("main.dashboard"))
+    return redirect(current_app.config["DASHBOARD_URL"])
 
 
 @main_bp.route("/display/<int:year>", methods=["GET"])
 def display(year):
     """Endpoint for the display page."""
     if not session.get("access_token"):
-        return redirect(url_for("auth.index"))
+        return redirect(current_app.config["INDEX_URL"])
 
     # Validate year range
     if not Config.MIN_YEAR <= year <= Config.CURRENT_YEAR:
-        return redirect(url_for("main.dashboard"))
+        return redirect(current_app.config["DASHBOARD_URL"])
 
     username = session.get("username")
-    user_context = DatabaseService.get_user_context(username, year)
+    user_context = DatabaseService.get_user_context_data(username, year)
 
     logging.info("Display user context: %s for year %d", username, year)
 
-    if user_context:
+    if user_context is not None:
         return render_template(
             "template.html",
-            context=json.loads(user_context.context),
+            context=user_context,
             project_year=current_app.config["PROJECT_YEAR"],
             star_repo=current_app.config["STAR_REPO"],
         )
 
     # If no context but request exists, redirect to wait
     if DatabaseService.get_requested_user(username, year):
-        return redirect(url_for("main.wait", year=year))
+        return redirect(current_app.config["WAIT_URL"] % year)
 
-    return redirect(url_for("main.dashboard"))
+    return redirect(current_app.config["DASHBOARD_URL"])
 
 
 @main_bp.route("/consent", methods=["GET"])
@@ -2,26 +2,61 @@
 Data processing service for handling GitHub data fetching and processing.
 """
 
-import json
 import logging
+import queue
 import threading
-from datetime import datetime
+from typing import Callable, Optional
+import orjson
 from flask import current_app
 
 from utils.context import get_context
 from services.database_service import DatabaseService
 from services.github_service import GitHubService
 
+# Shared worker pool so concurrent /load calls can't fan out unbounded threads.
+# Workers are daemons so shutdown never waits on queued GitHub fetches; claims
+# left behind are cleared by DatabaseService on the next startup.
+_MAX_WORKERS = 8
+_TASKS: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+_WORKERS: list[threading.Thread] = []
+_WORKERS_LOCK = threading.Lock()
+
+
+def _worker() -> None:
+    """Run queued tasks for the lifetime of the process."""
+    while True:
+        task = _TASKS.get()
+        try:
+            task()
+        except Exception as e:
+            logging.error("Error in background task: %s", e)
+
+
+def _submit(task: Callable[[], None]) -> None:
+    """Queue a task, starting the daemon workers on first use."""
+    with _WORKERS_LOCK:
+        while len(_WORKERS) < _MAX_WORKERS:
+            worker = threading.Thread(
+                target=_worker, name=f"gh-fetch-{len(_WORKERS)}", daemon=True
+            )
+            worker.start()
+            _WORKERS.append(worker)
+    _TASKS.put(task)
+
 
 class DataService:
     """Service for data processing operations."""
 
     @staticmethod
     def process_user_data(
-        username: str, access_token: str, year: int, timezone: str
+        username: str,
+        access_token: str,
+        year: int,
+        timezone: str,
+        basic_info: Optional[dict] = None,
     ) -> None:
-        """Process user data in a background thread."""
-        # Get the current app instance before starting the thread
+        """Process user data on the background worker pool."""
+        # Get the current app instance before handing off to the worker
         # pylint: disable=protected-access
         # This is the recommended Flask pattern for accessing app context in threads
         app = current_app._get_current_object()
@@ -30,13 +65,16 @@ class DataService:
             with app.app_context():
                 try:
                     # Fetch GitHub context data
-                    context = get_context(username, access_token, year, timezone)
-                    logging.info("Context of %s: %s", username, json.dumps(context))
+                    context = get_context(
+                        username, access_token, year, timezone, basic_info
+                    )
+                    # Serialize once for both the debug log and the database
+                    payload = orjson.dumps(context)
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("Context of %s: %s", username, payload.decode())
 
                     # Save context to database
-                    DatabaseService.add_user_context(
-                        username, year, json.dumps(context)
-                    )
+                    DatabaseService.add_user_context(username, year, payload)
 
                 except Exception as e:
                     logging.error("Error fetching data: %s", e)
@@ -44,21 +82,4 @@ class DataService:
                 # Star the repository
                 GitHubService.star_repository(access_token)
 
-        fetch_thread = threading.Thread(target=fetch_data)
-        fetch_thread.daemon = True  # Ensure thread doesn't prevent shutdown
-        fetch_thread.start()
-
-    @staticmethod
-    def validate_year(year: int) -> bool:
-        """Validate if the year is within acceptable range."""
-        current_year = datetime.now().year
-        return 2008 <= year <= current_year
-
-    @staticmethod
-    def validate_request_data(
-        access_token: str, username: str, timezone: str, year: int
-    ) -> bool:
-        """Validate request data."""
-        return all(
-            [access_token, username, timezone, year]
-        ) and DataService.validate_year(year)
+        _submit(fetch_data)
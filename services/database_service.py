@@ -3,14 +3,23 @@ Database service for handling database operations.
 """
 
 import logging
-from typing import Optional
-from sqlalchemy import and_
+import threading
+from typing import Literal, Optional
+import orjson
+import zstandard as zstd
+from cachetools import TTLCache
+from sqlalchemy import delete, exists, literal, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from models.models import db, RequestedUser, UserContext
 
 
 class DatabaseService:
     """Service for database operations."""
 
+    # Context is immutable once written, so keep recently parsed rows in process
+    _context_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+    _context_cache_lock = threading.RLock()
+
     @staticmethod
     def init_db() -> None:
         """Initialize the database."""
@@ -20,57 +29,118 @@ class DatabaseService:
     @staticmethod
     def _cleanup_orphaned_users() -> None:
         """Clean up users without context data."""
-        missing_users = (
-            db.session.query(RequestedUser)
-            .outerjoin(
-                UserContext,
-                (RequestedUser.username == UserContext.username)
-                & (RequestedUser.year == UserContext.year),
+        result = db.session.execute(
+            delete(RequestedUser).where(
+                ~exists().where(
+                    UserContext.username == RequestedUser.username,
+                    UserContext.year == RequestedUser.year,
+                )
             )
-            .filter(UserContext.username.is_(None))
-            .all()
         )
-        for user in missing_users:
-            logging.info("Removing orphaned user: %s", user.username)
-            db.session.query(RequestedUser).filter_by(
-                username=user.username, year=user.year
-            ).delete()
+        logging.info("Removed %d orphaned users", result.rowcount)
         db.session.commit()
 
     @staticmethod
-    def get_user_context(username: str, year: int) -> Optional[UserContext]:
-        """Get user context from database."""
-        return UserContext.query.filter(
-            and_(UserContext.username == username, UserContext.year == year)
-        ).first()
+    def get_user_context(username: str, year: int) -> Optional[bytes]:
+        """Get the compressed user context from database."""
+        with db.session.no_autoflush:
+            return db.session.execute(
+                select(UserContext.context).where(
+                    UserContext.username == username, UserContext.year == year
+                )
+            ).scalar_one_or_none()
+
+    @staticmethod
+    def get_requested_user(username: str, year: int) -> bool:
+        """Check whether a requested user exists in database."""
+        with db.session.no_autoflush:
+            return (
+                db.session.execute(
+                    select(literal(1)).where(
+                        RequestedUser.username == username, RequestedUser.year == year
+                    )
+                ).scalar()
+                is not None
+            )
+
+    @staticmethod
+    def get_user_context_data(username: str, year: int) -> Optional[dict]:
+        """Get the parsed context data for a user without loading the model."""
+        key = (username, year)
+        with DatabaseService._context_cache_lock:
+            context = DatabaseService._context_cache.get(key)
+        if context is not None:
+            return context
+
+        raw_context = DatabaseService.get_user_context(username, year)
+        if raw_context is None:
+            return None
+
+        context = orjson.loads(DatabaseService._decompress_context(raw_context))
+        with DatabaseService._context_cache_lock:
+            DatabaseService._context_cache[key] = context
+        return context
 
     @staticmethod
-    def get_requested_user(username: str, year: int) -> Optional[RequestedUser]:
-        """Get requested user from database."""
-        return RequestedUser.query.filter(
-            and_(RequestedUser.username == username, RequestedUser.year == year)
-        ).first()
+    def get_user_state(username: str, year: int) -> tuple[bool, bool]:
+        """Check whether a user has context data and a pending request."""
+        with db.session.no_autoflush:
+            has_context, has_request = db.session.execute(
+                select(
+                    exists().where(
+                        UserContext.username == username, UserContext.year == year
+                    ),
+                    exists().where(
+                        RequestedUser.username == username, RequestedUser.year == year
+                    ),
+                )
+            ).one()
+        return bool(has_context), bool(has_request)
 
     @staticmethod
-    def add_requested_user(username: str, year: int) -> bool:
-        """Add a new requested user."""
+    def claim_request(
+        username: str, year: int
+    ) -> Literal["has_context", "already_requested", "claimed", "error"]:
+        """Record a new request unless the user already has context or a request."""
         try:
-            requested_user = RequestedUser(username=username, year=year)
-            db.session.add(requested_user)
+            has_context, has_request = DatabaseService.get_user_state(username, year)
+            if has_context:
+                return "has_context"
+            if has_request:
+                return "already_requested"
+
+            result = db.session.execute(
+                sqlite_insert(RequestedUser)
+                .values(username=username, year=year)
+                .on_conflict_do_nothing()
+            )
             db.session.commit()
-            return True
+            return "claimed" if result.rowcount else "already_requested"
         except Exception as e:
-            logging.error("Error saving requested user: %s", e)
+            logging.error("Error claiming request: %s", e)
             db.session.rollback()
-            return False
+            return "error"
 
     @staticmethod
-    def add_user_context(username: str, year: int, context: str) -> bool:
-        """Add user context to database."""
+    def _decompress_context(raw_context: bytes | str) -> bytes | str:
+        """Decompress stored context, passing through legacy plain JSON rows."""
+        if isinstance(raw_context, str):
+            return raw_context
+        return zstd.ZstdDecompressor().decompress(raw_context)
+
+    @staticmethod
+    def add_user_context(username: str, year: int, context: bytes) -> bool:
+        """Add compressed user context JSON to database."""
         try:
-            user_context = UserContext(username=username, context=context, year=year)
+            user_context = UserContext(
+                username=username,
+                context=zstd.ZstdCompressor(level=3).compress(context),
+                year=year,
+            )
             db.session.add(user_context)
             db.session.commit()
+            with DatabaseService._context_cache_lock:
+                DatabaseService._context_cache.pop((username, year), None)
             return True
         except Exception as e:
             logging.error("Error saving user context: %s", e)
@@ -5,7 +5,32 @@ GitHub service for handling GitHub API operations.
 import logging
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config.config import Config
+from utils.fetch_data import BASIC_FRAGMENT, parse_basic
+
+# Reuse keep-alive connections to GitHub across requests
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+VIEWER_QUERY = """
+query {
+    viewer {
+        login
+        ...BasicFields
+    }
+}
+""" + BASIC_FRAGMENT
 
 
 class GitHubService:
@@ -18,7 +43,7 @@ class GitHubService:
             return None
 
         try:
-            token_response = requests.post(
+            token_response = _SESSION.post(
                 Config.GITHUB_TOKEN_URL,
                 headers={"Accept": "application/json"},
                 data={
@@ -37,25 +62,32 @@ class GitHubService:
 
     @staticmethod
     def get_user_info(access_token: str) -> dict:
-        """Get user information from GitHub API."""
+        """Get the viewer's login and basic profile from the GitHub GraphQL API."""
         try:
-            headers = {"Authorization": f"Bearer {access_token}"}
-            user_response = requests.get(
-                f"{Config.GITHUB_API_BASE_URL}/user",
-                headers=headers,
+            user_response = _SESSION.post(
+                Config.GITHUB_GRAPHQL_URL,
+                headers={"Authorization": f"Bearer {access_token}"},
+                json={"query": VIEWER_QUERY},
                 timeout=Config.REQUEST_TIMEOUT,
             )
             user_response.raise_for_status()
-            return user_response.json()
+            viewer = (user_response.json().get("data") or {}).get("viewer")
         except requests.exceptions.RequestException as e:
             logging.error("Error getting user info: %s", e)
             return {}
 
+        if not viewer:
+            logging.error("Error getting user info: %s", user_response.text)
+            return {}
+
+        # Same shape as the basic info in utils.fetch_data, plus the login
+        return {"login": viewer["login"], **parse_basic(viewer)}
+
     @staticmethod
     def star_repository(access_token: str) -> bool:
         """Star the repository."""
         try:
-            star_response = requests.put(
+            star_response = _SESSION.put(
                 f"{Config.GITHUB_API_BASE_URL}/user/starred/{Config.STAR_REPO}",
                 headers={
                     "Authorization": f"token {access_token}",
@@ -11,7 +11,7 @@ document.getElementById('inputForm').addEventListener('submit', function (event)
   var accessToken = document.getElementById('accessToken').value;
   var username = document.getElementById('username').value;
   var timezone = document.getElementById('timezone').value;
-  var year = document.getElementById('year').value;
+  var year = parseInt(document.getElementById('year').value, 10);
 
   // Hide the form
   document.getElementById('inputForm').style.display = 'none';
@@ -2,7 +2,8 @@
 Module for generating context data for GitHub statistics.
 
 Functions:
-    get_context(username: str, token: str, year: int, time_zone: str) -> dict:
+    get_context(username: str, token: str, year: int, time_zone: str,
+                basic_info: Optional[dict] = None) -> dict:
         Generate context data for the given year from the provided data.
 """
 
@@ -11,6 +12,7 @@ import logging
 import re
 from datetime import datetime, timedelta
 from itertools import groupby
+from typing import Optional
 
 import pytz
 
@@ -85,7 +87,13 @@ def _get_commit_type(message: str) -> str:
     return "others"
 
 
-def get_context(username: str, token: str, year: int, time_zone: str) -> dict:
+def get_context(
+    username: str,
+    token: str,
+    year: int,
+    time_zone: str,
+    basic_info: Optional[dict] = None,
+) -> dict:
     """
     Generate context data for the given year from the provided data.
 
@@ -94,11 +102,12 @@ def get_context(username: str, token: str, year: int, time_zone: str) -> dict:
         token (str): The GitHub access token.
         year (int): The year to generate the context data.
         time_zone (str): The timezone.
+        basic_info (Optional[dict]): Already fetched basic info, if any.
 
     Returns:
         dict: The context data.
     """
-    data = get_github_info(username, token, year)
+    data = get_github_info(username, token, year, basic_info)
 
     commit_type = [
         _get_commit_type(commit["message"])
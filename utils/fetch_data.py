@@ -2,11 +2,15 @@
 This module provides functions to fetch GitHub data using the GitHub GraphQL API.
 
 Functions:
-    get_github_info(username: str, token: str, year: int) -> dict:
+    parse_basic(node: dict) -> dict:
+        Convert a user node selected with BASIC_FRAGMENT into the basic info shape.
+    get_github_info(username: str, token: str, year: int,
+                    basic_info: Optional[dict] = None) -> dict:
         Get the GitHub information for the given year.
 """
 
 import logging
+from typing import Optional
 
 import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -30,38 +34,56 @@ def _graphql_query(query: str, variables: dict, token: str) -> dict:
     return response.json()["data"]
 
 
+BASIC_FRAGMENT = """
+fragment BasicFields on User {
+    id
+    name
+    avatarUrl
+    followers {
+        totalCount
+    }
+    following {
+        totalCount
+    }
+    createdAt
+}
+"""
+
+
+def parse_basic(node: dict) -> dict:
+    """
+    Convert a node selected with BASIC_FRAGMENT into the basic info shape.
+
+    Args:
+        node (dict): The GraphQL user node.
+
+    Returns:
+        dict: The basic information.
+    """
+    return {
+        "id": node["id"],
+        "name": node["name"],
+        "avatar_url": node["avatarUrl"],
+        "follower": node["followers"]["totalCount"],
+        "following": node["following"]["totalCount"],
+        "created_time": node["createdAt"],
+    }
+
+
 def _get_basic(user_name: str, token: str) -> dict:
     query = """
     query($username: String!) {
         user(login: $username) {
-            id
-            name
-            avatarUrl
-            followers {
-                totalCount
-            }
-            following {
-                totalCount
-            }
-            createdAt
+            ...BasicFields
         }
     }
-    """
+    """ + BASIC_FRAGMENT
 
     variables = {
         "username": user_name,
     }
 
-    result = _graphql_query(query, variables, token)["user"]
-
-    return {
-        "id": result["id"],
-        "name": result["name"],
-        "avatar_url": result["avatarUrl"],
-        "follower": result["followers"]["totalCount"],
-        "following": result["following"]["totalCount"],
-        "created_time": result["createdAt"],
-    }
+    return parse_basic(_graphql_query(query, variables, token)["user"])
 
 
 def _get_repo(
@@ -356,7 +378,9 @@ def _get_contribution(user_name: str, token: str, year: int) -> dict:
     }
 
 
-def get_github_info(username: str, token: str, year: int) -> dict:
+def get_github_info(
+    username: str, token: str, year: int, basic_info: Optional[dict] = None
+) -> dict:
     """
     Get the GitHub information for the given year.
 
@@ -364,13 +388,15 @@ def get_github_info(username: str, token: str, year: int) -> dict:
         username (str): The GitHub username.
         token (str): The GitHub access token.
         year (int): The year to get the information.
+        basic_info (Optional[dict]): Already fetched basic info, if any.
 
     Returns:
         dict: The GitHub information.
     """
 
-    logging.info("Processing basic info: username=%s", username)
-    basic_info = _get_basic(username, token)
+    if basic_info is None:
+        logging.info("Processing basic info: username=%s", username)
+        basic_info = _get_basic(username, token)
     if not basic_info["id"]:
         raise ValueError("Failed to get user id")
 